@@ -0,0 +1,22 @@
+"""Fixture comum: só as definições do app.py (sem a UI) contra um SQLite temporário."""
+from pathlib import Path
+
+import pytest
+
+APP = Path(__file__).resolve().parents[1] / "app.py"
+
+
+@pytest.fixture()
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    src = APP.read_text(encoding="utf-8")
+    cut = src.index("st.set_page_config(")
+    ns = {"__name__": "app_defs"}
+    exec(compile(src[:cut], str(APP), "exec"), ns)
+    # caches do Streamlit são por função, não por namespace: zera o que sobrou de outro teste
+    ns["get_engine"].clear()
+    ns["invalidate_data_cache"]()
+    eng = ns["get_engine"]()
+    ns["metadata"].create_all(eng)
+    ns["exec_stmt"](ns["insert"](ns["obras"]).values(id=1, nome="Obra A"))
+    return ns
@@ -0,0 +1,12 @@
+"""Colunas de texto do df de agendamentos (category) com valores NULL no banco."""
+
+
+def test_nulos_viram_texto_vazio(app):
+    app["exec_stmt"](app["insert"](app["concretagens"]).values(
+        id=1, obra_id=1, data="2026-01-12", hora_inicio="08:00", duracao_min=60,
+        status="Agendado", usina=None, bomba=None, equipe=None,
+    ))
+    df = app["get_concretagens_df"]("2026-01-01", "2026-01-31")
+    row = df.to_dict("records")[0]
+    for col in ("cliente", "cidade", "usina", "bomba", "equipe"):
+        assert str(row[col] or "") == "", col
@@ -0,0 +1,20 @@
+"""Busca livre da Agenda (get_concretagens_df(search=...))."""
+
+
+def test_busca_ignora_caixa_com_acentos(app):
+    ex, ins = app["exec_stmt"], app["insert"]
+    ex(ins(app["obras"]).values(id=2, nome="CONSTRUÇÃO Norte", cidade="SÃO PAULO"))
+    ex(ins(app["concretagens"]).values(
+        id=1, obra_id=2, data="2026-01-12", hora_inicio="08:00", duracao_min=60, status="Agendado",
+    ))
+    ex(ins(app["concretagens"]).values(
+        id=2, obra_id=1, data="2026-01-12", hora_inicio="09:00", duracao_min=60, status="Agendado",
+    ))
+
+    def buscar(q):
+        return app["get_concretagens_df"]("2026-01-01", "2026-01-31", search=q)["id"].tolist()
+
+    assert buscar("construção") == [1]
+    assert buscar("são paulo") == [1]
+    assert buscar("obra a") == [2]
+    assert buscar("50%") == []
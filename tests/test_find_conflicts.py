@@ -0,0 +1,33 @@
+"""find_conflicts: formatos de hora_inicio gravados no banco."""
+import pytest
+
+
+def _add(app, id_, hora, dur, bomba="B1"):
+    app["exec_stmt"](app["insert"](app["concretagens"]).values(
+        id=id_, obra_id=1, data="2026-01-12", hora_inicio=hora,
+        duracao_min=dur, bomba=bomba, equipe="", status="Agendado",
+    ))
+
+
+def _ids(app, hora, dur, bomba="B1"):
+    return [c["id"] for c in app["find_conflicts"]("2026-01-12", hora, dur, bomba, "")]
+
+
+def test_hora_com_um_digito_conflita(app):
+    _add(app, 1, "9:30", 60)
+    assert _ids(app, "10:00", 30) == [1]
+    assert _ids(app, "10:30", 30) == []
+
+
+def test_formatos_de_hora(app):
+    _add(app, 1, "08:00", 60)
+    _add(app, 2, "7:05:00", 30)
+    _add(app, 3, "xx", 30)
+    assert sorted(_ids(app, "07:20", 60)) == [1, 2]
+    assert _ids(app, "06:00", 60) == []
+
+
+@pytest.mark.parametrize("hora", ["ab:cd", "08:3x", "--:--", "9:ab", "9:3", ""])
+def test_hora_malformada_nao_conflita(app, hora):
+    _add(app, 1, hora, 600)
+    assert _ids(app, "00:00", 24 * 60) == []